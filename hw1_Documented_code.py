@@ -4,9 +4,30 @@
 @author: chinmaietiyyagura
 """
 
+import atexit
+import csv
+import functools
+import os
+
+import numpy as np
 import pandas as pd
 from datetime import datetime
-import statistics
+
+@functools.lru_cache(maxsize=512)
+def _parse_date(date_str):
+    """
+    Parse a MM/DD/YY date string, caching the result.
+
+    strptime re-interprets its format string on every call; exercise
+    logs repeat dates often, so memoizing the parse avoids that cost.
+
+    Args:
+        date_str (str): Date in MM/DD/YY format.
+
+    Returns:
+        datetime: Parsed date.
+    """
+    return datetime.strptime(date_str, "%m/%d/%y")
 
 class ExerciseData:
     """
@@ -19,6 +40,10 @@ class ExerciseData:
         date (datetime): Date when the exercise was performed.
     """
 
+    # Fixed slots instead of a per-instance __dict__: smaller objects
+    # and attribute access by offset rather than hash lookup.
+    __slots__ = ("exercise", "duration", "calories_burned", "date")
+
     def __init__(self, exercise, duration, calories_burned, date):
         """
         Initialize ExerciseData object.
@@ -47,6 +72,13 @@ class ExerciseManager:
     _instance = None
     csv_file = "exercise_data.csv"
     columns = ["Exercise", "Duration", "Calories_Burned", "Date"]
+    _dtypes = {
+        "Exercise": object,
+        "Duration": np.int64,
+        "Calories_Burned": np.int64,
+        "Date": "datetime64[D]",
+    }
+    _initial_capacity = 16
 
     def __new__(cls):
         """
@@ -57,28 +89,275 @@ class ExerciseManager:
         """
         if not cls._instance:
             cls._instance = super(ExerciseManager, cls).__new__(cls)
-            cls._instance.exercise_df = cls._instance.load_data()
+            cls._instance._version = 0
+            cls._instance._name_index = {}
+            cls._instance._indexes_stale = True
+            cls._instance._date_sorted = None
+            cls._instance._date_sorted_idx = None
+            cls._instance._date_sorted_stale = True
+            cls._instance._dirty = False
+            cls._instance._stats_cache = None
+            cls._instance.load_data()
+            cls._instance._open_append_handle()
+            # LIFO: flush runs first at exit, then the handle closes.
+            atexit.register(cls._instance._append_fh.close)
+            atexit.register(cls._instance.flush)
         return cls._instance
 
-    def load_data(self):
+    def _open_append_handle(self):
+        """
+        Open the CSV once in append mode for the life of the process.
+
+        Reopening the file per added row cost an open/close syscall pair
+        each time; a persistent 64 KiB-buffered handle reduces appends
+        to a buffered write. Writes the header if the file is new.
+        """
+        write_header = (not os.path.exists(self.csv_file)
+                        or os.path.getsize(self.csv_file) == 0)
+        self._append_fh = open(self.csv_file, "a", newline="", buffering=1 << 16)
+        self._append_writer = csv.writer(self._append_fh)
+        if write_header:
+            self._append_writer.writerow(self.columns)
+
+    def flush(self):
+        """
+        Write pending changes to the CSV file, if any.
+
+        Edits and deletions only mark the data dirty; the actual rewrite
+        happens here, so a burst of N quick mutations pays for one file
+        rewrite instead of N. Registered with atexit so nothing is lost
+        on a normal exit.
+        """
+        if self._append_fh.closed:
+            return
+        if self._dirty:
+            self.rewrite_all()
+            self._dirty = False
+        else:
+            self._append_fh.flush()
+
+    def _allocate(self, capacity):
+        """
+        Allocate one typed array per column (struct-of-arrays layout).
+
+        Keeping each column in its own contiguous ndarray lets the hot
+        operations (reductions, equality filters, single-cell edits) run
+        as C-level array operations instead of going through pandas'
+        block manager per cell.
+
+        Args:
+            capacity (int): Number of row slots to allocate.
+        """
+        self._cols = {
+            name: np.empty(capacity, dtype=dtype)
+            for name, dtype in self._dtypes.items()
+        }
+        self._cap = capacity
+        self._len = 0
+
+    def _ensure_capacity(self, extra=1):
+        """
+        Grow the column arrays geometrically to fit `extra` more rows.
+
+        Doubling on exhaustion (like CPython's list) keeps total copy
+        cost linear, so appends stay amortized O(1) instead of the
+        O(N^2) a reallocate-per-append would cost.
+
+        Args:
+            extra (int): Number of additional rows to make room for.
+        """
+        needed = self._len + extra
+        if needed <= self._cap:
+            return
+        new_cap = self._cap
+        while new_cap < needed:
+            new_cap *= 2
+        for name, col in self._cols.items():
+            new_col = np.empty(new_cap, dtype=col.dtype)
+            new_col[:self._len] = col[:self._len]
+            self._cols[name] = new_col
+        self._cap = new_cap
+
+    def _as_dataframe(self):
+        """
+        Wrap the live column slices in a DataFrame.
+
+        Construction from a dict of already-typed ndarrays skips all of
+        pandas' type inference, and copy=False lets the frame reference
+        the column slices directly; callers get the familiar DataFrame
+        interface while the arrays stay the source of truth.
+
+        Returns:
+            pandas.DataFrame: View over the current rows.
+        """
+        return pd.DataFrame(
+            {name: col[:self._len] for name, col in self._cols.items()},
+            copy=False)
+
+    def _rebuild_indexes(self):
+        """
+        Rebuild the exercise-name lookup index if stale.
+
+        The index maps exercise name -> row positions, so name filters
+        become a dict lookup plus an iloc on precomputed positions
+        instead of a full-column scan.
+        """
+        if not self._indexes_stale:
+            return
+        self._name_index = {}
+        for i, name in enumerate(self._cols["Exercise"][:self._len]):
+            self._name_index.setdefault(name, []).append(i)
+        self._indexes_stale = False
+
+    def _rebuild_date_index(self):
+        """
+        Rebuild the sorted date permutation if stale.
+
+        Keeping the Date column's sort order lets a date-equality filter
+        run as two O(log N) searchsorted probes that bracket the
+        matching range, instead of scanning every row.
+        """
+        if not self._date_sorted_stale:
+            return
+        dates = self._cols["Date"][:self._len]
+        self._date_sorted_idx = np.argsort(dates, kind="stable")
+        self._date_sorted = dates[self._date_sorted_idx]
+        self._date_sorted_stale = False
+
+    def filter_by_exercise(self, exercise_name):
+        """
+        Return all rows for a given exercise name.
+
+        Args:
+            exercise_name (str): Name of the exercise to filter by.
+
+        Returns:
+            pandas.DataFrame: Matching rows.
+        """
+        return self._filter_by_exercise(exercise_name, self._version)
+
+    def filter_by_date(self, date):
         """
-        Load exercise data from the CSV file.
+        Return all rows for a given date.
+
+        Args:
+            date (datetime): Date to filter by.
 
         Returns:
-            pandas.DataFrame: Loaded exercise data.
+            pandas.DataFrame: Matching rows.
+        """
+        return self._filter_by_date(date, self._version)
+
+    @functools.lru_cache(maxsize=128)
+    def _filter_by_exercise(self, exercise_name, version):
+        """
+        Cached exercise-name filter.
+
+        The version argument is bumped on every mutation, so stale cache
+        entries are never returned; repeated identical filters between
+        mutations hit the cache instead of re-scanning all rows.
+        """
+        self._rebuild_indexes()
+        return self._as_dataframe().iloc[self._name_index.get(exercise_name, [])]
+
+    @functools.lru_cache(maxsize=128)
+    def _filter_by_date(self, date, version):
+        """
+        Cached date filter; see _filter_by_exercise for the version key.
+        """
+        self._rebuild_date_index()
+        day = np.datetime64(date, "D")
+        lo = np.searchsorted(self._date_sorted, day, side="left")
+        hi = np.searchsorted(self._date_sorted, day, side="right")
+        return self._as_dataframe().iloc[self._date_sorted_idx[lo:hi]]
+
+    def load_data(self):
+        """
+        Load exercise data from the CSV file into the column arrays.
+
+        Uses the stdlib csv reader over a 1 MB buffer rather than
+        pd.read_csv: the schema is four known columns, so pandas' type
+        inference and date guessing are pure overhead here.
         """
         try:
-            exercise_df = pd.read_csv(self.csv_file, parse_dates=['Date'])
+            with open(self.csv_file, "r", newline="", buffering=1 << 20) as f:
+                reader = csv.reader(f)
+                next(reader, None)  # header; None if the file is empty
+                rows = list(reader)
         except FileNotFoundError:
-            # File doesn't exist, create an empty DataFrame
-            exercise_df = pd.DataFrame(columns=self.columns)
-        return exercise_df
+            # File doesn't exist, start with empty arrays
+            rows = []
+        self._allocate(max(2 * len(rows), self._initial_capacity))
+        self._len = len(rows)
+        for i, row in enumerate(rows):
+            self._cols["Exercise"][i] = row[0]
+            self._cols["Duration"][i] = int(row[1])
+            self._cols["Calories_Burned"][i] = int(row[2])
+        if rows:
+            # One C-level conversion for the whole column instead of a
+            # Python-level strptime per row; the file stores ISO dates.
+            self._cols["Date"][:self._len] = np.array(
+                [row[3] for row in rows], dtype="datetime64[D]")
+
+    def append_row(self, row):
+        """
+        Append a single row to the CSV file without rewriting it.
+
+        Writes through the persistent append handle, so the common add
+        path is a single buffered write with no open/close per row.
+
+        Args:
+            row (tuple): Values in column order (Exercise, Duration,
+                Calories_Burned, Date).
+        """
+        self._append_writer.writerow(row)
 
-    def save_data(self):
+    def rewrite_all(self):
         """
-        Save exercise data to the CSV file.
+        Rewrite the entire CSV file from the in-memory data.
+
+        Only needed after edits or deletions; plain additions use
+        append_row instead. Uses csv.writer over a 1 MB buffer rather
+        than to_csv, which pays quoting/stringification machinery per
+        cell on a schema that is known to be plain ints, ISO dates, and
+        short names.
+        """
+        # Drain the append buffer first: the rewrite below includes
+        # every row, and a later flush of buffered appends would tack
+        # duplicates onto the fresh file.
+        self._append_fh.flush()
+        n = self._len
+        with open(self.csv_file, "w", newline="", buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(self.columns)
+            writer.writerows(zip(
+                self._cols["Exercise"][:n],
+                self._cols["Duration"][:n],
+                self._cols["Calories_Burned"][:n],
+                self._cols["Date"][:n].astype(str),
+            ))
+
+    def get_duration_stats(self):
+        """
+        Return mean and median duration, cached until the next mutation.
+
+        Repeated analyze requests between mutations are common in an
+        interactive session; the reductions only rerun after an
+        add/edit/delete clears the cache.
+
+        Returns:
+            dict: {"mean": float, "median": float}, or None if there is
+                no data.
         """
-        self.exercise_df.to_csv(self.csv_file, index=False)
+        if self._len == 0:
+            return None
+        if self._stats_cache is None:
+            durations = self._cols["Duration"][:self._len]
+            self._stats_cache = {
+                "mean": float(durations.mean()),
+                "median": float(np.median(durations)),
+            }
+        return self._stats_cache
 
     def get_all_data(self):
         """
@@ -87,7 +366,7 @@ class ExerciseManager:
         Returns:
             pandas.DataFrame: All exercise data.
         """
-        return self.exercise_df
+        return self._as_dataframe()
 
     def add_data(self, exercise, duration, calories_burned, date):
         """
@@ -99,9 +378,22 @@ class ExerciseManager:
             calories_burned (int): Calories burned during the exercise.
             date (datetime): Date when the exercise was performed.
         """
-        new_row = pd.DataFrame([[exercise, duration, calories_burned, date]], columns=self.columns)
-        self.exercise_df = pd.concat([self.exercise_df, new_row], ignore_index=True)
-        self.save_data()
+        self._ensure_capacity()
+        idx = self._len
+        self._cols["Exercise"][idx] = exercise
+        self._cols["Duration"][idx] = duration
+        self._cols["Calories_Burned"][idx] = calories_burned
+        self._cols["Date"][idx] = np.datetime64(date, "D")
+        self._len += 1
+        if not self._indexes_stale:
+            self._name_index.setdefault(exercise, []).append(idx)
+        self._date_sorted_stale = True
+        self._version += 1
+        self._stats_cache = None
+        if self._dirty:
+            # A full rewrite is already pending and will cover this row.
+            return
+        self.append_row((exercise, duration, calories_burned, date.strftime("%Y-%m-%d")))
 
     def edit_data(self, index, exercise, duration, calories_burned, date):
         """
@@ -113,22 +405,60 @@ class ExerciseManager:
             duration (int): New duration of the exercise in minutes.
             calories_burned (int): New calories burned during the exercise.
             date (datetime): New date when the exercise was performed.
+
+        Raises:
+            IndexError: If index does not refer to an existing row.
         """
-        self.exercise_df.at[index, "Exercise"] = exercise
-        self.exercise_df.at[index, "Duration"] = duration
-        self.exercise_df.at[index, "Calories_Burned"] = calories_burned
-        self.exercise_df.at[index, "Date"] = date
-        self.save_data()
+        if not 0 <= index < self._len:
+            raise IndexError(f"no exercise data at index {index}")
+        if not self._indexes_stale:
+            # Move the row between name buckets instead of marking the
+            # whole index stale.
+            old_name = self._cols["Exercise"][index]
+            if old_name != exercise:
+                self._name_index[old_name].remove(index)
+                self._name_index.setdefault(exercise, []).append(index)
+        self._cols["Exercise"][index] = exercise
+        self._cols["Duration"][index] = duration
+        self._cols["Calories_Burned"][index] = calories_burned
+        self._cols["Date"][index] = np.datetime64(date, "D")
+        self._date_sorted_stale = True
+        self._version += 1
+        self._stats_cache = None
+        self._dirty = True
 
     def delete_data(self, index):
         """
         Delete existing exercise data.
 
+        Row order carries no meaning for this log, so deletion swaps the
+        last row into the freed slot and shrinks the length: O(1) per
+        delete instead of shifting (or copying) the whole tail.
+
         Args:
             index (int): Index of the data to delete.
+
+        Raises:
+            IndexError: If index does not refer to an existing row.
         """
-        self.exercise_df = self.exercise_df.drop(index)
-        self.save_data()
+        if not 0 <= index < self._len:
+            raise IndexError(f"no exercise data at index {index}")
+        last = self._len - 1
+        if not self._indexes_stale:
+            old_name = self._cols["Exercise"][index]
+            self._name_index[old_name].remove(index)
+            if index != last:
+                # The last row moves to `index`; repoint its index entry.
+                moved_name = self._cols["Exercise"][last]
+                positions = self._name_index[moved_name]
+                positions[positions.index(last)] = index
+        for col in self._cols.values():
+            col[index] = col[last]
+        self._len -= 1
+        self._date_sorted_stale = True
+        self._version += 1
+        self._stats_cache = None
+        self._dirty = True
 
 class ExerciseApp:
     """
@@ -143,6 +473,119 @@ class ExerciseApp:
         Initialize ExerciseApp object.
         """
         self.exercise_manager = ExerciseManager()
+        # Dispatch table: one dict lookup per menu tick instead of
+        # walking an if/elif ladder of comparisons.
+        self._actions = {
+            1: self._read,
+            2: self._add,
+            3: self._edit,
+            4: self._delete,
+            5: self._analyze,
+            6: self._filter,
+        }
+
+    def _prompt_int(self, msg, valid=None):
+        """
+        Prompt until the user enters a valid integer.
+
+        A bad value used to raise an uncaught ValueError out of run();
+        validating here also means the dispatch table never sees an
+        out-of-range choice.
+
+        Args:
+            msg (str): Prompt text.
+            valid (collection, optional): Acceptable values; any integer
+                is accepted when omitted.
+
+        Returns:
+            int: The validated integer.
+        """
+        while True:
+            try:
+                value = int(input(msg))
+            except ValueError:
+                pass
+            else:
+                if valid is None or value in valid:
+                    return value
+            print("Invalid input. Please try again.")
+
+    def _read(self):
+        """
+        Print all exercise data.
+        """
+        print(self.exercise_manager.get_all_data())
+
+    def _add(self):
+        """
+        Prompt for a new exercise entry and add it.
+        """
+        exercise = input("Enter exercise name: ")
+        duration = self._prompt_int("Enter duration in minutes: ")
+        calories_burned = self._prompt_int("Enter calories burned: ")
+        date_str = input("Enter date (MM/DD/YY): ")
+        date = _parse_date(date_str)
+        self.exercise_manager.add_data(exercise, duration, calories_burned, date)
+        print("Exercise added successfully.")
+
+    def _edit(self):
+        """
+        Prompt for replacement values and edit an existing entry.
+        """
+        index = self._prompt_int("Enter index to edit: ")
+        exercise = input("Enter new exercise name: ")
+        duration = self._prompt_int("Enter new duration in minutes: ")
+        calories_burned = self._prompt_int("Enter new calories burned: ")
+        date_str = input("Enter new date (MM/DD/YY): ")
+        date = _parse_date(date_str)
+        try:
+            self.exercise_manager.edit_data(index, exercise, duration, calories_burned, date)
+        except IndexError:
+            print(f"No exercise data at index {index}.")
+            return
+        print("Exercise edited successfully.")
+
+    def _delete(self):
+        """
+        Prompt for an index and delete that entry.
+        """
+        index = self._prompt_int("Enter index to delete: ")
+        try:
+            self.exercise_manager.delete_data(index)
+        except IndexError:
+            print(f"No exercise data at index {index}.")
+            return
+        print("Exercise deleted successfully.")
+
+    def _analyze(self):
+        """
+        Print mean and median duration.
+        """
+        stats = self.exercise_manager.get_duration_stats()
+        if stats is not None:
+            print(f"Mean Duration: {stats['mean']} mins")
+            print(f"Median Duration: {stats['median']} mins")
+        else:
+            print("No data available for analysis.")
+
+    def _filter(self):
+        """
+        Prompt for a filter and print the matching rows.
+        """
+        df = self.exercise_manager.get_all_data()
+        if df.empty:
+            print("No data available to filter.")
+            return
+        filter_option = self._prompt_int(
+            "Filter by:\n1. Exercise\n2. Date\nEnter your choice: ", valid=(1, 2))
+        if filter_option == 1:
+            exercise_name = input("Enter exercise name to filter: ")
+            filtered_data = self.exercise_manager.filter_by_exercise(exercise_name)
+        else:
+            date_str = input("Enter date to filter (MM/DD/YY): ")
+            date = _parse_date(date_str)
+            filtered_data = self.exercise_manager.filter_by_date(date)
+        print(filtered_data)
 
     def display_menu(self):
         """
@@ -160,61 +603,23 @@ class ExerciseApp:
         """
         Run the console application.
         """
+        # Bind hot names to locals: LOAD_FAST inside the loop instead of
+        # a globals/builtins dict lookup per use.
+        prompt = self._prompt_int
+        mgr = self.exercise_manager
+        actions = self._actions
+        menu_choices = range(1, 8)
+
         while True:
+            # Make data durable before blocking on the next prompt.
+            mgr.flush()
             self.display_menu()
-            choice = int(input("Enter your choice: "))
-
-            if choice == 1:
-                # Read data
-                print(self.exercise_manager.get_all_data())
-            elif choice == 2:
-                # Add data
-                exercise = input("Enter exercise name: ")
-                duration = int(input("Enter duration in minutes: "))
-                calories_burned = int(input("Enter calories burned: "))
-                date_str = input("Enter date (MM/DD/YY): ")
-                date = datetime.strptime(date_str, "%m/%d/%y")
-                self.exercise_manager.add_data(exercise, duration, calories_burned, date)
-                print("Exercise added successfully.")
-            elif choice == 3:
-                # Edit data
-                index = int(input("Enter index to edit: "))
-                exercise = input("Enter new exercise name: ")
-                duration = int(input("Enter new duration in minutes: "))
-                calories_burned = int(input("Enter new calories burned: "))
-                date_str = input("Enter new date (MM/DD/YY): ")
-                date = datetime.strptime(date_str, "%m/%d/%y")
-                self.exercise_manager.edit_data(index, exercise, duration, calories_burned, date)
-                print("Exercise edited successfully.")
-            elif choice == 4:
-                # Delete data
-                index = int(input("Enter index to delete: "))
-                self.exercise_manager.delete_data(index)
-                print("Exercise deleted successfully.")
-            elif choice == 5:
-                # Analyze data (mean and median)
-                if not self.exercise_manager.get_all_data().empty:
-                    mean_duration = statistics.mean(self.exercise_manager.get_all_data()["Duration"])
-                    median_duration = statistics.median(self.exercise_manager.get_all_data()["Duration"])
-                    print(f"Mean Duration: {mean_duration} mins")
-                    print(f"Median Duration: {median_duration} mins")
-                else:
-                    print("No data available for analysis.")
-            elif choice == 6:
-                # Filter data
-                filter_option = int(input("Filter by:\n1. Exercise\n2. Date\nEnter your choice: "))
-                if filter_option == 1:
-                    exercise_name = input("Enter exercise name to filter: ")
-                    filtered_data = self.exercise_manager.get_all_data()[self.exercise_manager.get_all_data()["Exercise"] == exercise_name]
-                elif filter_option == 2:
-                    date_str = input("Enter date to filter (MM/DD/YY): ")
-                    date = datetime.strptime(date_str, "%m/%d/%y")
-                    filtered_data = self.exercise_manager.get_all_data()[self.exercise_manager.get_all_data()["Date"] == date]
-                print(filtered_data)
-            elif choice == 7:
+            # Validation happens in the prompt, so the dispatch below
+            # never sees an invalid choice.
+            choice = prompt("Enter your choice: ", valid=menu_choices)
+            if choice == 7:
                 break
-            else:
-                print("Invalid choice. Please try again.")
+            actions[choice]()
 
 if __name__ == "__main__":
     app = ExerciseApp()